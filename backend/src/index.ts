@@ -21,12 +21,23 @@ function toCamelCase(obj: any) {
 app.get('/api/cars', (req, res) => {
   const db = new sqlite3.Database(DB_PATH);
 
+  // Plate-level enrichment is shared by every listing of the same car and
+  // LLM analyses by listings with the same price and mileage. Rows from
+  // before the plates table fall back to their own URL-level columns.
   const sql = `
     SELECT
-      r.price, r.mileage, r.year, r.place, 
-      n.*
+      r.price, r.mileage, r.year, r.place,
+      n.url, n.price_num, n.mileage_num, n.plate, n.estimated_price, n.deal_score,
+      COALESCE(p.name, n.name) AS name,
+      COALESCE(p.apk_expiry, n.apk_expiry) AS apk_expiry,
+      COALESCE(p.finnik_url, n.finnik_url) AS finnik_url,
+      COALESCE(a.llm_summary, n.llm_summary) AS llm_summary,
+      COALESCE(a.llm_score, n.llm_score) AS llm_score
     FROM raw_cars r
     JOIN normalized_cars n ON r.url = n.url
+    LEFT JOIN plates p ON n.normalized_plate = p.plate
+    LEFT JOIN llm_analyses a
+      ON a.plate = n.normalized_plate AND a.llm_inputs = n.price_num || ':' || n.mileage_num
   `;
 
   db.all(sql, [], (err, rows) => {
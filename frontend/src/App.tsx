@@ -15,6 +15,7 @@ interface CarListing {
   estimatedPrice?: number;
   llmScore?: number;
   llmSummary?: string;
+  dealScore?: number;
 }
 
 function stripMarkdown(text: string) {
@@ -44,7 +45,7 @@ const App: React.FC = () => {
   const [cars, setCars] = useState<CarListing[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
-  const [sortField, setSortField] = useState<'mileageNum' | 'priceNum' | 'estimatedPrice'  | 'llmScore'>('mileageNum');
+  const [sortField, setSortField] = useState<'mileageNum' | 'priceNum' | 'estimatedPrice'  | 'llmScore' | 'dealScore'>('mileageNum');
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('asc');
   const [selectedCar, setSelectedCar] = useState<CarListing | null>(null);
 
@@ -91,13 +92,14 @@ const App: React.FC = () => {
             Sort by:
             <select
               value={sortField}
-              onChange={e => setSortField(e.target.value as 'mileageNum' | 'priceNum' | 'estimatedPrice'  | 'llmScore')}
+              onChange={e => setSortField(e.target.value as 'mileageNum' | 'priceNum' | 'estimatedPrice'  | 'llmScore' | 'dealScore')}
               style={{ marginLeft: 8 }}
             >
               <option value="mileageNum">Mileage</option>
               <option value="priceNum">Price</option>
               <option value="estimatedPrice">Estimated Price</option>
               <option value="llmScore">LLM Score</option>
+              <option value="dealScore">Deal Score</option>
 
             </select>
           </label>
@@ -126,6 +128,7 @@ const App: React.FC = () => {
                 <th>APK Expiry</th>
                 <th>Finnik</th>
                 <th>Place</th>
+                <th>Deal Score</th>
                 <th>LLM Score</th>
                 <th>LLM Summary</th>
               </tr>
@@ -150,6 +153,7 @@ const App: React.FC = () => {
                     ) : 'N/A'}
                   </td>
                   <td>{car.place ? car.place : 'N/A'}</td>
+                  <td>{typeof car.dealScore === 'number' ? car.dealScore.toFixed(2) : 'N/A'}</td>
                   <td>{car.llmScore ? car.llmScore : 'N/A'}</td>
                   <td>
                     <button onClick={e => { e.stopPropagation(); setSelectedCar(car); }}>LLM Summary</button>
@@ -169,6 +173,7 @@ const App: React.FC = () => {
           <div className="side-panel-content">
             <div><strong>Price:</strong> {selectedCar.price}</div>
             <div><strong>Mileage:</strong> {selectedCar.mileage}</div>
+            <div><strong>Deal Score:</strong> {typeof selectedCar.dealScore === 'number' ? selectedCar.dealScore.toFixed(2) : 'N/A'}</div>
             <div><strong>LLM Score:</strong> {selectedCar.llmScore}</div>
             <div style={{ marginTop: 24 }}>
               <h3>LLM Summary</h3>
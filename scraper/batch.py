@@ -0,0 +1,86 @@
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+from helpers import extract_model_name, clean_url
+
+# int64 holds any 18-digit number
+MAX_DIGITS = 18
+# Longer strings are parsed one by one, so a single long value does not
+# widen the code point array of every row
+MAX_WIDTH = 32
+
+
+def _parse_digits_row(text: str) -> int:
+    digits = "".join(ch for ch in text if "0" <= ch <= "9")
+    return int(digits) if digits and len(digits) <= MAX_DIGITS else 0
+
+
+def parse_digits(values: List[Optional[Any]]) -> np.ndarray:
+    """
+    Parse strings like '€ 18.950,-' or '54.321 km' into integers by keeping
+    only their digits, for all values at once. Values without digits, or
+    with more digits than fit in int64, become 0.
+    """
+    texts = ["" if v is None else str(v) for v in values]
+    out = np.zeros(len(texts), dtype=np.int64)
+    long_rows = [i for i, text in enumerate(texts) if len(text) > MAX_WIDTH]
+    for i in long_rows:
+        out[i] = _parse_digits_row(texts[i])
+        texts[i] = ""
+
+    text = np.array(texts, dtype=str)
+    width = text.dtype.itemsize // 4
+    if len(text) == 0 or width == 0:
+        return out
+    # Unicode arrays store one UCS-4 code point per character; walk them
+    # one column at a time so only per-row temporaries are allocated
+    codes = text.view(np.uint32).reshape(len(text), width)
+    n_digits = np.zeros(len(text), dtype=np.int8)
+    for col in range(width):
+        # Code points below '0' wrap around to large values
+        value = codes[:, col] - np.uint32(48)
+        digit = value <= 9
+        out[digit] = out[digit] * 10 + value[digit]
+        n_digits += digit
+    out[n_digits > MAX_DIGITS] = 0
+    return out
+
+
+def clean_urls(values: List[Optional[str]]) -> np.ndarray:
+    """
+    Batch version of helpers.clean_url. Plain str methods beat NumPy's
+    string routines on long unique URLs, so this stays a per-row loop.
+    """
+    return np.array([clean_url(v) for v in values], dtype=object)
+
+
+def extract_model_names(titles: List[Optional[str]]) -> np.ndarray:
+    """
+    Batch version of helpers.extract_model_name. Listings share few distinct
+    titles, so each distinct title is matched only once.
+    """
+    names = {title: extract_model_name(title) for title in set(titles)}
+    return np.array([names[title] for title in titles], dtype=object)
+
+
+def normalize_batch(raw_cars: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Parse the listing fields of all raw cars as columns. Returns typed
+    arrays; a year of 0 means the year is unknown.
+    """
+    return {
+        "url": clean_urls([car["url"] for car in raw_cars]),
+        "original_name": extract_model_names([car["title"] for car in raw_cars]),
+        "price_num": parse_digits([car["price"] for car in raw_cars]),
+        "mileage_num": parse_digits([car["mileage"] for car in raw_cars]),
+        "year": parse_digits([car["year"] for car in raw_cars]),
+    }
+
+
+def batch_rows(batch: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Split batch columns back into one dict of plain Python values per car.
+    """
+    columns = {key: values.tolist() for key, values in batch.items()}
+    n = len(next(iter(columns.values()), []))
+    return [{key: values[i] for key, values in columns.items()} for i in range(n)]
@@ -0,0 +1,111 @@
+"""
+Import-time benchmark for the main.py subcommands, based on `python -X importtime`.
+
+Usage:
+    python bench_imports.py [--repeat N] [--top N] [--budget-ms MS]
+
+For each subcommand it imports main.py plus the modules that subcommand
+loads, reports the import time and the slowest modules, and fails if a
+subcommand imports a module it should not need or exceeds the budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Modules each subcommand imports when it runs (see main.COMMANDS)
+COMMAND_IMPORTS = {
+    "scrape": ["main", "scrape"],
+    "normalize": ["main", "normalize"],
+    "reparse": ["main", "normalize"],
+}
+
+# Heavy modules that must only be loaded on first use
+FORBIDDEN_IMPORTS = {
+    "scrape": ["openai", "aiohttp", "dotenv", "numpy", "llm", "normalize"],
+    "normalize": ["openai", "dotenv"],
+    "reparse": ["openai", "dotenv"],
+}
+
+
+def run_importtime(modules: List[str]) -> str:
+    code = "; ".join(f"import {m}" for m in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return result.stderr
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse `-X importtime` output into (module, depth, self_us, cumulative_us) rows.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = len(name) - len(name.lstrip())
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def bench_command(command: str, repeat: int) -> Dict[str, object]:
+    best = None
+    for _ in range(repeat):
+        rows = parse_importtime(run_importtime(COMMAND_IMPORTS[command]))
+        total_us = sum(self_us for _, _, self_us, _ in rows)
+        if best is None or total_us < best["total_us"]:
+            best = {"total_us": total_us, "rows": rows}
+    loaded = {name for name, _, _, _ in best["rows"]}
+    best["forbidden"] = [
+        m for m in FORBIDDEN_IMPORTS.get(command, []) if m in loaded
+    ]
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    for command in COMMAND_IMPORTS:
+        try:
+            result = bench_command(command, args.repeat)
+        except RuntimeError as e:
+            print(f"{command}: import failed: {e}")
+            failed = True
+            continue
+
+        total_ms = result["total_us"] / 1000
+        print(f"{command}: {total_ms:.1f} ms, {len(result['rows'])} modules")
+        min_depth = min(r[1] for r in result["rows"])
+        top_level = [r for r in result["rows"] if r[1] == min_depth]
+        top_level.sort(key=lambda r: r[3], reverse=True)
+        for name, _, _, cumulative_us in top_level[: args.top]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+        if result["forbidden"]:
+            print(f"    unexpected imports: {', '.join(result['forbidden'])}")
+            failed = True
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            print(f"    over budget of {args.budget_ms:.1f} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Throughput benchmark for the batch normalization stage.
+
+Usage:
+    python bench_normalize.py [--rows N] [--repeat N]
+
+Compares batch.normalize_batch with parsing the same synthetic listings
+one car at a time, checks both give the same result, and reports rows/s.
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List, Dict, Any, Callable
+
+from batch import normalize_batch
+from helpers import extract_model_name, clean_url
+
+TITLES = [
+    "Toyota Corolla Touring Sports 1.8 Hybrid Active",
+    "Toyota Corolla Touring Sports 1.8 Hybrid Business Plus",
+    "Toyota Corolla Touring Sports 2.0 Hybrid Executive",
+    "Toyota Corolla Touring Sports 1.8 Hybrid Dynamic | Navi | Camera",
+    "Toyota Corolla Touring Sports 1.2 Turbo Comfort",
+    "Toyota Corolla Touring Sports 1.8 Hybrid First Edition Premium",
+]
+
+
+def make_raw_cars(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    cars = []
+    for i in range(n):
+        cars.append(
+            {
+                "title": rng.choice(TITLES),
+                "price": rng.choice(["€ {:,}".format(rng.randint(9000, 20000)).replace(",", "."), None]),
+                "mileage": "{:,} km".format(rng.randint(5000, 120000)).replace(",", "."),
+                "url": rng.choice(
+                    [f"https://dealer.nl/occasion/{i}?utm_source=gaspedaal", "N/A"]
+                ),
+                "year": str(rng.randint(2018, 2024)),
+            }
+        )
+    return cars
+
+
+def normalize_per_row(raw_cars: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    def digits(value):
+        text = "".join(filter(str.isdigit, value)) if value else ""
+        return int(text) if text else 0
+
+    return {
+        "url": [clean_url(car["url"]) for car in raw_cars],
+        "original_name": [extract_model_name(car["title"]) for car in raw_cars],
+        "price_num": [digits(car["price"]) for car in raw_cars],
+        "mileage_num": [digits(car["mileage"]) for car in raw_cars],
+        "year": [digits(car["year"]) for car in raw_cars],
+    }
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    raw_cars = make_raw_cars(args.rows)
+
+    expected = normalize_per_row(raw_cars)
+    batch = normalize_batch(raw_cars)
+    for key, values in expected.items():
+        if batch[key].tolist() != values:
+            print(f"mismatch in column {key}")
+            return 1
+
+    per_row = best_time(lambda: normalize_per_row(raw_cars), args.repeat)
+    batched = best_time(lambda: normalize_batch(raw_cars), args.repeat)
+    print(f"rows:    {args.rows}")
+    print(f"per-row: {per_row * 1000:8.1f} ms  {args.rows / per_row:12,.0f} rows/s")
+    print(f"batch:   {batched * 1000:8.1f} ms  {args.rows / batched:12,.0f} rows/s")
+    print(f"speedup: {per_row / batched:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import hashlib
+import sqlite3
+import zlib
+from typing import List, Optional, Tuple
+
+
+def init_blob_table(conn) -> None:
+    c = conn.cursor()
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            size INTEGER,
+            data BLOB,
+            stored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.commit()
+
+
+def put_blob(conn, content: Optional[str]) -> Optional[str]:
+    """
+    Store zlib-compressed content keyed by its SHA-256 hash and return the hash.
+    Content that is already stored is not written again.
+    """
+    if content is None:
+        return None
+    raw = content.encode("utf-8")
+    blob_hash = hashlib.sha256(raw).hexdigest()
+    c = conn.cursor()
+    c.execute(
+        "INSERT OR IGNORE INTO blobs (hash, size, data) VALUES (?, ?, ?)",
+        (blob_hash, len(raw), sqlite3.Binary(zlib.compress(raw, 9))),
+    )
+    return blob_hash
+
+
+def get_blob(conn, blob_hash: Optional[str]) -> Optional[str]:
+    """
+    Load and decompress a blob by hash. Callers select only the hash columns
+    and call this when the content is actually needed.
+    """
+    if not blob_hash:
+        return None
+    c = conn.cursor()
+    c.execute("SELECT data FROM blobs WHERE hash = ?", (blob_hash,))
+    row = c.fetchone()
+    if row is None:
+        return None
+    return zlib.decompress(row[0]).decode("utf-8")
+
+
+def gc_blobs(conn, references: List[Tuple[str, str]]) -> int:
+    """
+    Delete the blobs that no (table, column) in references points to
+    anymore and return how many were deleted.
+    """
+    used = " UNION ".join(
+        f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL"
+        for table, column in references
+    )
+    c = conn.cursor()
+    c.execute(f"DELETE FROM blobs WHERE hash NOT IN ({used})")
+    conn.commit()
+    return c.rowcount
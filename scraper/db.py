@@ -0,0 +1,10 @@
+def ensure_column(conn, table: str, column: str, decl: str) -> None:
+    """
+    Add a column to an existing table if it is missing, so databases
+    created before the column existed keep working.
+    """
+    c = conn.cursor()
+    c.execute(f"PRAGMA table_info({table})")
+    if column not in {row[1] for row in c.fetchall()}:
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+        conn.commit()
@@ -1,4 +1,5 @@
 import requests
+from typing import Optional
 from bs4 import BeautifulSoup
 
 
@@ -28,6 +29,16 @@ def get_version_name_from_finnik(original_name: str, plate: str) -> str:
     Falls back to original_name if not found.
     """
     html = fetch_finnik_html(plate)
+    return parse_version_name(html, original_name)
+
+
+def parse_version_name(html: Optional[str], original_name: str) -> str:
+    """
+    Parse the 'Uitvoering' (version name) from Finnik HTML that was
+    already fetched. Falls back to original_name if not found.
+    """
+    if not html:
+        return original_name
     soup = BeautifulSoup(html, "html.parser")
 
     for row in soup.select(".row"):
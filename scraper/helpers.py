@@ -10,24 +10,29 @@ def normalize_plate_number(plate: Optional[str]) -> Optional[str]:
     return plate.replace("-", "").upper()
 
 
+MODEL_ENDINGS = [
+    "Active",
+    "Business Plus",
+    "Business",
+    "Comfort",
+    "Executive",
+    "Dynamic",
+    "Premium",
+    "Plus",
+]
+_ENDING_PATTERN = "|".join(
+    re.escape(e) for e in sorted(MODEL_ENDINGS, key=len, reverse=True)
+)
+MODEL_NAME_PATTERN = re.compile(
+    rf"(\d\.\d\s*Hybrid(?:\s+[A-Za-z]+)*\s(?:{_ENDING_PATTERN}))", re.IGNORECASE
+)
+
+
 def extract_model_name(text: Optional[str]) -> Optional[str]:
     """Extracts the real model name like '1.8 Hybrid Active' from a string."""
     if not text:
         return None
-    endings = [
-        "Active",
-        "Business Plus",
-        "Business",
-        "Comfort",
-        "Executive",
-        "Dynamic",
-        "Premium",
-        "Plus",
-    ]
-    endings_sorted = sorted(endings, key=len, reverse=True)
-    ending_pattern = "|".join([re.escape(e) for e in endings_sorted])
-    pattern = rf"(\d\.\d\s*Hybrid(?:\s+[A-Za-z]+)*\s(?:{ending_pattern}))"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = MODEL_NAME_PATTERN.search(text)
     if match:
         return match.group(1).strip()
     return text.strip()
@@ -59,9 +64,13 @@ def extract_plate_from_url(url: Optional[str], cookies: dict) -> Optional[str]:
         return None
     
     html = fetch_html_with_cookie(url, cookies)
+    return extract_plate_from_html(html)
+
+
+def extract_plate_from_html(html: Optional[str]) -> Optional[str]:
     if html is None:
         return None
-    
+
     # ① data-testid
     m = re.search(r'data-testid="svg-Kenteken-([^"]+)"', html)
     if m:
@@ -1,16 +1,13 @@
-from openai import OpenAI
 import os
 import asyncio
+from functools import lru_cache
 from bs4 import BeautifulSoup
 import json
-from typing import Tuple, Any, Dict
-from dotenv import load_dotenv
+from typing import Tuple, Any, Dict, Optional
 from helpers import normalize_plate_number
 from finnik import fetch_finnik_html
 from rdw import fetch_rdw_data
 
-load_dotenv()
-
 
 def sanitize_html(html: str) -> str:
     """
@@ -32,10 +29,20 @@ def sanitize_html(html: str) -> str:
         return ""
 
 
-client = OpenAI(
-    api_key=os.getenv("DEEPSEEK_API_KEY"),
-    base_url="https://api.deepseek.com",
-)
+@lru_cache(maxsize=None)
+def get_client() -> Any:
+    """
+    Create the Deepseek client on first use, so importing this module
+    does not load openai or read .env.
+    """
+    from openai import OpenAI
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return OpenAI(
+        api_key=os.getenv("DEEPSEEK_API_KEY"),
+        base_url="https://api.deepseek.com",
+    )
 
 
 def build_car_analysis_prompt(
@@ -105,7 +112,7 @@ def send_messages(messages: list[dict], tools: list[dict]) -> Any:
     """
     Wrapper around Deepseek chat completion.
     """
-    response = client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model="deepseek-chat",
         messages=messages,
         tools=tools,
@@ -131,11 +138,18 @@ def parse_llm_response(message: Any) -> Tuple[str, int]:
 
 def get_llm_summary(
     norm_car: Dict[str, Any],
-) -> Tuple[str, int]:
+    finnik_html: Optional[str] = None,
+    rdw_data: Optional[Dict[str, Any]] = None,
+) -> Optional[Tuple[str, int]]:
+    """
+    Return (llm_summary, llm_score) for a car, or None if the LLM call failed.
+    """
     tools = [get_report_summary_tool()]
     plate = normalize_plate_number(norm_car["plate"])
-    rdw_data = asyncio.run(fetch_rdw_data(plate))
-    finnik_html = fetch_finnik_html(plate)
+    if rdw_data is None:
+        rdw_data = asyncio.run(fetch_rdw_data(plate))
+    if finnik_html is None:
+        finnik_html = fetch_finnik_html(plate)
     system_msg = {
         "role": "system",
         "content": "You are a professional Dutch used-car data analysis assistant.",
@@ -150,7 +164,7 @@ def get_llm_summary(
         return parse_llm_response(message)
     except Exception as e:
         print(f"Error in LLM processing: {e}")
-        return "Unable to generate summary.", 0
+        return None
 
 
 if __name__ == "__main__":
@@ -158,5 +172,4 @@ if __name__ == "__main__":
     with open("gaspedaal_cars.json", "r", encoding="utf-8") as f:
         cars = json.load(f)
     norm_car = next(car for car in cars if car.get("plate") == plate)
-    llm_summary, llm_score = get_llm_summary(norm_car)
-    print(llm_summary, llm_score)
+    print(get_llm_summary(norm_car))
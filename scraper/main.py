@@ -1,6 +1,4 @@
 import sys
-from scrape import scrape_and_save_raw
-from normalize import normalize_and_save
 
 url = (
     "https://www.gaspedaal.nl/toyota/corolla/stationwagon"
@@ -10,12 +8,38 @@ url = (
 cookies = {"authId": "8a8ec16c-8399-4950-acea-7e8458b25c9e"}
 
 
+# Each subcommand imports only the modules it needs, so `main.py scrape`
+# does not pay for openai, aiohttp or the LLM client.
+def run_scrape() -> None:
+    from scrape import scrape_and_save_raw
+
+    success = scrape_and_save_raw(url, cookies)
+    if success:
+        print("Scraping completed successfully")
+    else:
+        print("Scraping failed")
+
+
+def run_normalize() -> None:
+    from normalize import normalize_and_save
+
+    normalize_and_save(cookies)
+
+
+def run_reparse() -> None:
+    from normalize import reparse_stored_cars
+
+    reparse_stored_cars()
+
+
+COMMANDS = {
+    "scrape": run_scrape,
+    "normalize": run_normalize,
+    "reparse": run_reparse,
+}
+
+
 if __name__ == "__main__":
-    if "scrape" in sys.argv:
-        success = scrape_and_save_raw(url, cookies)
-        if success:
-            print("Scraping completed successfully")
-        else:
-            print("Scraping failed")
-    if "normalize" in sys.argv:
-        normalize_and_save(cookies)
+    for name, command in COMMANDS.items():
+        if name in sys.argv:
+            command()
@@ -1,74 +1,270 @@
 import json
-from typing import List, Dict, Any
+import asyncio
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 import sqlite3
 
 from helpers import (
-    extract_model_name,
-    extract_plate_from_url,
+    extract_plate_from_html,
+    fetch_html_with_cookie,
     normalize_plate_number,
     get_apk_expiry_from_rdw,
 )
 
 from finnik import (
     get_Finnik_page,
-    get_version_name_from_finnik,
+    fetch_finnik_html,
+    parse_version_name,
 )
 from anwb import get_rijklaarprijs
 from llm import get_llm_summary
-from scrape import DB_PATH
+from rdw import fetch_rdw_data
+from scrape import DB_PATH, process_occasions_to_cars
+from blobstore import init_blob_table, put_blob, get_blob, gc_blobs
+from db import ensure_column
+from scoring import score_cars, select_for_llm, SCORING_WINDOW
+from batch import normalize_batch, batch_rows
 
 
-def normalize_car_data(raw_car: Dict[str, Any], cookies: dict) -> Dict[str, Any]:
-    price_str = raw_car["price"]
-    price_num = int("".join(filter(str.isdigit, price_str))) if price_str else 0
-    mileage_str = raw_car["mileage"]
-    mileage_num = int("".join(filter(str.isdigit, mileage_str))) if mileage_str else 0
-    url = raw_car["url"]
-    plate = extract_plate_from_url(url, cookies)
+# Every column holding a blob hash; blobs none of them refer to are removed
+BLOB_REFERENCES = [
+    ("raw_cars", "occasion_blob"),
+    ("normalized_cars", "occasion_blob"),
+    ("normalized_cars", "dealer_html_blob"),
+    ("plates", "finnik_html_blob"),
+    ("plates", "rdw_blob"),
+]
+
+
+def get_plate_record(conn, normalize_plate: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not normalize_plate:
+        return None
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT plate, name, apk_expiry, finnik_url, finnik_html_blob, rdw_blob
+        FROM plates
+        WHERE plate = ?
+        """,
+        (normalize_plate,),
+    )
+    row = c.fetchone()
+    if row is None:
+        return None
+    return {
+        "plate": row[0],
+        "name": row[1],
+        "apk_expiry": row[2],
+        "finnik_url": row[3],
+        "finnik_html_blob": row[4],
+        "rdw_blob": row[5],
+    }
+
+
+def get_llm_analysis(
+    conn, normalize_plate: Optional[str], llm_inputs: str
+) -> Optional[Tuple[str, int]]:
+    if not normalize_plate:
+        return None
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT llm_summary, llm_score FROM llm_analyses
+        WHERE plate = ? AND llm_inputs = ?
+        """,
+        (normalize_plate, llm_inputs),
+    )
+    row = c.fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def enrich_plate(conn, normalize_plate: str, original_name: str) -> Dict[str, Any]:
+    """
+    Fetch the plate-dependent data (Finnik page, version name, APK expiry)
+    once and store it, so other listings of the same car reuse it.
+    """
+    finnik_html = fetch_finnik_html(normalize_plate)
+    c = conn.cursor()
+    c.execute(
+        """
+        INSERT OR REPLACE INTO plates (plate, name, apk_expiry, finnik_url, finnik_html_blob)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            normalize_plate,
+            parse_version_name(finnik_html, original_name),
+            get_apk_expiry_from_rdw(normalize_plate),
+            get_Finnik_page(normalize_plate),
+            put_blob(conn, finnik_html),
+        ),
+    )
+    conn.commit()
+    return get_plate_record(conn, normalize_plate)
+
+
+def find_estimated_price(
+    conn, normalize_plate: Optional[str], mileage_num: int
+) -> Optional[int]:
+    """
+    Reuse the ANWB estimate of another listing of the same car with the same mileage.
+    """
+    if not normalize_plate:
+        return None
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT estimated_price FROM normalized_cars
+        WHERE normalized_plate = ? AND mileage_num = ? AND estimated_price IS NOT NULL
+        LIMIT 1
+        """,
+        (normalize_plate, mileage_num),
+    )
+    row = c.fetchone()
+    return row[0] if row else None
+
+
+def normalize_car_data(
+    conn, listing: Dict[str, Any], dealer_html: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Enrich one listing whose fields were already parsed by batch.normalize_batch.
+    """
+    price_num = listing["price_num"]
+    mileage_num = listing["mileage_num"]
+    url = listing["url"]
+    plate = extract_plate_from_html(dealer_html)
     normalize_plate = normalize_plate_number(plate)
-    finnik_url = get_Finnik_page(normalize_plate)
-    original_name = extract_model_name(raw_car["title"])
-    name = get_version_name_from_finnik(original_name, normalize_plate)
-    estimated_price = get_rijklaarprijs(mileage_num, plate, name)
+    original_name = listing["original_name"]
+    plate_record = get_plate_record(conn, normalize_plate)
+    if normalize_plate and plate_record is None:
+        plate_record = enrich_plate(conn, normalize_plate, original_name)
+    name = plate_record["name"] if plate_record else original_name
+    estimated_price = find_estimated_price(conn, normalize_plate, mileage_num)
+    if estimated_price is None:
+        estimated_price = get_rijklaarprijs(mileage_num, plate, name)
     return {
         "url": url,
         "name": name,
+        "year": listing["year"],
         "price_num": price_num,
         "mileage_num": mileage_num,
         "plate": plate,
-        "apk_expiry": get_apk_expiry_from_rdw(normalize_plate),
-        "finnik_url": finnik_url,
+        "apk_expiry": plate_record["apk_expiry"] if plate_record else None,
+        "finnik_url": plate_record["finnik_url"] if plate_record else None,
         "estimated_price": estimated_price,
     }
 
 
 def create_normalized_table(conn):
     c = conn.cursor()
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS plates (
+            plate TEXT PRIMARY KEY,
+            name TEXT,
+            apk_expiry TIMESTAMP,
+            finnik_url TEXT,
+            finnik_html_blob TEXT,
+            rdw_blob TEXT
+        )
+        """
+    )
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_analyses (
+            plate TEXT,
+            llm_inputs TEXT,
+            llm_summary TEXT,
+            llm_score INTEGER,
+            PRIMARY KEY (plate, llm_inputs)
+        )
+        """
+    )
+    # apk_expiry, finnik_url, llm_summary and llm_score only hold data
+    # written before the plates table existed
     c.execute(
         """
         CREATE TABLE IF NOT EXISTS normalized_cars (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             url TEXT UNIQUE,
             name TEXT,
+            year INTEGER,
             price_num INTEGER,
             mileage_num INTEGER,
             plate TEXT,
+            normalized_plate TEXT,
             apk_expiry TIMESTAMP,
             finnik_url TEXT,
             estimated_price INTEGER,
             llm_summary TEXT,
-            llm_score INTEGER
+            llm_score INTEGER,
+            dealer_html_blob TEXT,
+            occasion_blob TEXT,
+            deal_score REAL
         )
         """
     )
     conn.commit()
+    for column, decl in [
+        ("name", "TEXT"),
+        ("year", "INTEGER"),
+        ("apk_expiry", "TIMESTAMP"),
+        ("finnik_url", "TEXT"),
+        ("llm_summary", "TEXT"),
+        ("llm_score", "INTEGER"),
+        ("deal_score", "REAL"),
+        ("dealer_html_blob", "TEXT"),
+        ("normalized_plate", "TEXT"),
+        ("occasion_blob", "TEXT"),
+    ]:
+        ensure_column(conn, "normalized_cars", column, decl)
+    init_blob_table(conn)
+    migrate_url_level_enrichment(conn)
+
+
+def migrate_url_level_enrichment(conn) -> None:
+    """
+    Rows from before the plates table kept name, APK, Finnik and LLM data
+    on the URL row only. Copy it into plates and llm_analyses and link the
+    rows; their URL-level columns stay as they are. Failed analyses were
+    stored as "Unable to generate summary." and are not copied.
+    """
+    c = conn.cursor()
+    c.execute(
+        """
+        INSERT OR IGNORE INTO plates (plate, name, apk_expiry, finnik_url)
+        SELECT UPPER(REPLACE(plate, '-', '')), name, apk_expiry, finnik_url
+        FROM normalized_cars
+        WHERE normalized_plate IS NULL AND plate IS NOT NULL AND plate != ''
+        ORDER BY id DESC
+        """
+    )
+    c.execute(
+        """
+        INSERT OR IGNORE INTO llm_analyses (plate, llm_inputs, llm_summary, llm_score)
+        SELECT UPPER(REPLACE(plate, '-', '')), price_num || ':' || mileage_num,
+               llm_summary, llm_score
+        FROM normalized_cars
+        WHERE normalized_plate IS NULL AND plate IS NOT NULL AND plate != ''
+              AND llm_summary IS NOT NULL AND llm_summary != 'Unable to generate summary.'
+        ORDER BY id DESC
+        """
+    )
+    c.execute(
+        """
+        UPDATE normalized_cars
+        SET normalized_plate = UPPER(REPLACE(plate, '-', ''))
+        WHERE normalized_plate IS NULL AND plate IS NOT NULL AND plate != ''
+        """
+    )
+    conn.commit()
 
 
 def fetch_new_raw_cars(conn) -> list:
     c = conn.cursor()
     c.execute(
         """
-        SELECT title, price, mileage, url, year, place, scraped_at
+        SELECT title, price, mileage, url, year, place, scraped_at, occasion_blob
         FROM raw_cars
         WHERE DATE(scraped_at) = DATE('now', 'localtime')
         """
@@ -83,6 +279,7 @@ def fetch_new_raw_cars(conn) -> list:
             "year": row[4],
             "place": row[5],
             "scraped_at": row[6],
+            "occasion_blob": row[7],
         }
         for row in rows
     ]
@@ -97,46 +294,248 @@ def is_already_normalized(conn, raw_car: Dict[str, Any]) -> bool:
     return c.fetchone() is not None
 
 
+def load_car_pages(conn, car_id: int) -> Dict[str, Optional[str]]:
+    """
+    Load the stored dealer and Finnik pages of a normalized car, so it can
+    be re-parsed without refetching anything.
+    """
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT n.dealer_html_blob, p.finnik_html_blob
+        FROM normalized_cars n
+        LEFT JOIN plates p ON n.normalized_plate = p.plate
+        WHERE n.id = ?
+        """,
+        (car_id,),
+    )
+    row = c.fetchone()
+    if row is None:
+        return {"dealer_html": None, "finnik_html": None}
+    return {"dealer_html": get_blob(conn, row[0]), "finnik_html": get_blob(conn, row[1])}
+
+
 def insert_normalized_car(
     conn,
     norm_car: Dict[str, Any],
-    llm_summary: str,
-    llm_score: int,
+    dealer_html: Optional[str],
+    occasion_blob: Optional[str],
 ):
     c = conn.cursor()
     c.execute(
         """
         INSERT OR REPLACE INTO normalized_cars
-        (url, name, price_num, mileage_num, plate, apk_expiry, finnik_url, estimated_price, llm_summary, llm_score)
+        (url, name, year, price_num, mileage_num, plate, normalized_plate, estimated_price,
+         dealer_html_blob, occasion_blob)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             norm_car["url"],
             norm_car["name"],
+            norm_car["year"],
             norm_car["price_num"],
             norm_car["mileage_num"],
             norm_car["plate"],
-            norm_car["apk_expiry"],
-            norm_car["finnik_url"],
+            normalize_plate_number(norm_car["plate"]),
             norm_car["estimated_price"],
-            llm_summary,
-            llm_score,
+            put_blob(conn, dealer_html),
+            occasion_blob,
         ),
     )
     conn.commit()
 
 
+def fetch_scoring_pool(conn) -> List[Dict[str, Any]]:
+    """
+    Cars still waiting for a deal score plus the most recently scored ones,
+    which the fit uses as a reference.
+    """
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT n.id, n.url, COALESCE(p.name, n.name), n.year, n.price_num, n.mileage_num, n.plate,
+               COALESCE(p.apk_expiry, n.apk_expiry), COALESCE(p.finnik_url, n.finnik_url),
+               n.estimated_price, n.deal_score
+        FROM normalized_cars n
+        LEFT JOIN plates p ON n.normalized_plate = p.plate
+        WHERE n.deal_score IS NULL
+           OR n.id IN (
+               SELECT id FROM normalized_cars
+               WHERE deal_score IS NOT NULL
+               ORDER BY id DESC
+               LIMIT ?
+           )
+        """,
+        (SCORING_WINDOW,),
+    )
+    rows = c.fetchall()
+    return [
+        {
+            "id": row[0],
+            "url": row[1],
+            "name": row[2],
+            "year": row[3],
+            "price_num": row[4],
+            "mileage_num": row[5],
+            "plate": row[6],
+            "apk_expiry": row[7],
+            "finnik_url": row[8],
+            "estimated_price": row[9],
+            "deal_score": row[10],
+        }
+        for row in rows
+    ]
+
+
+def update_deal_score(conn, car_id: int, deal_score: float) -> None:
+    c = conn.cursor()
+    c.execute(
+        "UPDATE normalized_cars SET deal_score = ? WHERE id = ?",
+        (deal_score, car_id),
+    )
+    conn.commit()
+
+
+def llm_inputs_key(norm_car: Dict[str, Any]) -> str:
+    """
+    The listing-specific inputs of an LLM analysis. Listings of the same
+    plate with the same key can share one analysis.
+    """
+    return f"{norm_car['price_num']}:{norm_car['mileage_num']}"
+
+
+def analyze_plate(conn, norm_car: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    """
+    Run the LLM analysis for a car using the stored plate data, fetching
+    RDW data only once per plate. Each analysis is kept under its plate and
+    inputs, so listings of the same car at other prices do not replace it.
+    Returns None without storing anything if the LLM call failed.
+    """
+    normalize_plate = normalize_plate_number(norm_car["plate"])
+    record = get_plate_record(conn, normalize_plate)
+    rdw_json = get_blob(conn, record["rdw_blob"])
+    if rdw_json is None:
+        rdw_data = asyncio.run(fetch_rdw_data(normalize_plate))
+        rdw_blob = put_blob(conn, json.dumps(rdw_data, ensure_ascii=False))
+    else:
+        rdw_data = json.loads(rdw_json)
+        rdw_blob = record["rdw_blob"]
+    finnik_html = get_blob(conn, record["finnik_html_blob"])
+    c = conn.cursor()
+    c.execute("UPDATE plates SET rdw_blob = ? WHERE plate = ?", (rdw_blob, normalize_plate))
+    conn.commit()
+    analysis = get_llm_summary(norm_car, finnik_html, rdw_data)
+    if analysis is None:
+        return None
+    llm_summary, llm_score = analysis
+    c.execute(
+        """
+        INSERT OR REPLACE INTO llm_analyses (plate, llm_inputs, llm_summary, llm_score)
+        VALUES (?, ?, ?, ?)
+        """,
+        (normalize_plate, llm_inputs_key(norm_car), llm_summary, llm_score),
+    )
+    conn.commit()
+    return llm_summary, llm_score
+
+
 def normalize_and_save(cookies: dict) -> None:
     conn = sqlite3.connect(DB_PATH)
     create_normalized_table(conn)
-    raw_cars = fetch_new_raw_cars(conn)
-    new_count = 0
-    for raw_car in raw_cars:
-        if is_already_normalized(conn, raw_car):
+    raw_cars = [
+        raw_car
+        for raw_car in fetch_new_raw_cars(conn)
+        if not is_already_normalized(conn, raw_car)
+    ]
+    # Parse the listing fields of the whole run before any network calls
+    listings = batch_rows(normalize_batch(raw_cars))
+    for raw_car, listing in zip(raw_cars, listings):
+        dealer_html = fetch_html_with_cookie(listing["url"], cookies)
+        norm_car = normalize_car_data(conn, listing, dealer_html)
+        insert_normalized_car(conn, norm_car, dealer_html, raw_car["occasion_blob"])
+
+    # Score unscored cars against recent ones and only send promising cars
+    # to the LLM. The score is stored last, so an interrupted run resumes.
+    pool = fetch_scoring_pool(conn)
+    scores = score_cars(pool)
+    unscored = np.array([car["deal_score"] is None for car in pool], dtype=bool)
+    selected = select_for_llm(scores, unscored)
+    llm_count = 0
+    llm_failed = 0
+    for car, deal_score, is_new, use_llm in zip(pool, scores, unscored, selected):
+        if not is_new:
+            continue
+        norm_car = {
+            key: value for key, value in car.items() if key not in ("id", "deal_score")
+        }
+        normalize_plate = normalize_plate_number(norm_car["plate"])
+        # Without a plate there is no RDW or Finnik data to analyze
+        if (
+            use_llm
+            and get_plate_record(conn, normalize_plate) is not None
+            and get_llm_analysis(conn, normalize_plate, llm_inputs_key(norm_car)) is None
+        ):
+            if analyze_plate(conn, norm_car) is None:
+                # Leave the car unscored so the next run retries the analysis
+                llm_failed += 1
+                continue
+            llm_count += 1
+        update_deal_score(conn, car["id"], float(deal_score))
+    removed = gc_blobs(conn, BLOB_REFERENCES)
+    conn.close()
+    print(
+        f"Inserted {len(listings)} new normalized cars into the database "
+        f"({int(unscored.sum()) - llm_failed} scored, {llm_count} analyzed by the LLM, "
+        f"{llm_failed} failed, {removed} unused blobs removed)."
+    )
+
+
+def reparse_stored_cars() -> None:
+    """
+    Re-parse every stored car from its Gaspedaal occasion, dealer page and
+    Finnik page, without any network call.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    create_normalized_table(conn)
+    c = conn.cursor()
+    c.execute(
+        "SELECT id, occasion_blob FROM normalized_cars WHERE occasion_blob IS NOT NULL"
+    )
+    car_ids, raw_cars = [], []
+    for car_id, occasion_blob in c.fetchall():
+        occasion_json = get_blob(conn, occasion_blob)
+        if occasion_json is None:
             continue
-        norm_car = normalize_car_data(raw_car, cookies)
-        llm_summary, llm_score = get_llm_summary(norm_car)
-        insert_normalized_car(conn, norm_car, llm_summary, llm_score)
-        new_count += 1
+        parsed = process_occasions_to_cars([json.loads(occasion_json)])
+        if parsed:
+            car_ids.append(car_id)
+            raw_cars.append(parsed[0])
+
+    listings = batch_rows(normalize_batch(raw_cars))
+    for car_id, listing in zip(car_ids, listings):
+        pages = load_car_pages(conn, car_id)
+        plate = extract_plate_from_html(pages["dealer_html"])
+        normalize_plate = normalize_plate_number(plate)
+        name = listing["original_name"]
+        if pages["finnik_html"] is not None:
+            name = parse_version_name(pages["finnik_html"], name)
+            c.execute("UPDATE plates SET name = ? WHERE plate = ?", (name, normalize_plate))
+        c.execute(
+            """
+            UPDATE normalized_cars
+            SET name = ?, year = ?, price_num = ?, mileage_num = ?, plate = ?, normalized_plate = ?
+            WHERE id = ?
+            """,
+            (
+                name,
+                listing["year"],
+                listing["price_num"],
+                listing["mileage_num"],
+                plate,
+                normalize_plate,
+                car_id,
+            ),
+        )
+        conn.commit()
     conn.close()
-    print(f"Inserted {new_count} new normalized cars into the database.")
+    print(f"Re-parsed {len(listings)} stored cars.")
@@ -0,0 +1,111 @@
+import numpy as np
+from datetime import date
+from typing import List, Dict, Any, Optional
+
+# Cars with a deal score at or above this always go to the LLM
+SCORE_THRESHOLD = 1.0
+# New cars ranking in this best fraction of the pool go to the LLM
+TOP_FRACTION = 0.25
+# Below this many cars in the pool the fit is meaningless, so every new car is kept
+MIN_CARS_TO_FILTER = 8
+# Number of already scored cars, most recent first, that the fit also uses
+SCORING_WINDOW = 1000
+# Mileage per year above this robust z-score is penalized
+MILEAGE_Z_LIMIT = 2.0
+
+
+def _to_float_array(values: List[Any]) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    for i, v in enumerate(values):
+        try:
+            out[i] = float(v)
+        except (TypeError, ValueError):
+            pass
+    return out
+
+
+def _robust_z(values: np.ndarray) -> np.ndarray:
+    """
+    Z-score based on median and MAD, so a few extreme listings do not
+    dominate the scale.
+    """
+    median = np.nanmedian(values)
+    mad = np.nanmedian(np.abs(values - median)) * 1.4826
+    if not np.isfinite(mad) or mad == 0:
+        mad = np.nanstd(values)
+    if not np.isfinite(mad) or mad == 0:
+        return np.zeros_like(values)
+    return (values - median) / mad
+
+
+def _fill_missing(column: np.ndarray) -> np.ndarray:
+    if np.all(np.isnan(column)):
+        return np.zeros_like(column)
+    return np.where(np.isnan(column), np.nanmedian(column), column)
+
+
+def score_cars(
+    norm_cars: List[Dict[str, Any]], current_year: Optional[int] = None
+) -> np.ndarray:
+    """
+    Score a pool of cars at once, usually the new cars plus the most recent
+    scored ones, so scores stay comparable across runs. Price is fitted
+    against year, mileage and the ANWB estimated price; a car priced below
+    its fitted price gets a positive score, and extreme mileage for its age
+    is penalized. Cars without a price get a neutral score of 0.
+    """
+    n = len(norm_cars)
+    if n == 0:
+        return np.zeros(0)
+
+    price = _to_float_array([c.get("price_num") for c in norm_cars])
+    year = _to_float_array([c.get("year") for c in norm_cars])
+    mileage = _to_float_array([c.get("mileage_num") for c in norm_cars])
+    estimated = _to_float_array([c.get("estimated_price") for c in norm_cars])
+    price[price <= 0] = np.nan
+    year[year <= 0] = np.nan
+    mileage[mileage <= 0] = np.nan
+
+    year = _fill_missing(year)
+    mileage = _fill_missing(mileage)
+    estimated = _fill_missing(estimated)
+
+    features = np.column_stack([year, mileage, estimated])
+    std = features.std(axis=0)
+    std[std == 0] = 1.0
+    design = np.column_stack(
+        [np.ones(n), (features - features.mean(axis=0)) / std]
+    )
+
+    priced = ~np.isnan(price)
+    scores = np.zeros(n)
+    if priced.sum() >= 2:
+        coef, *_ = np.linalg.lstsq(design[priced], price[priced], rcond=None)
+        residual = design @ coef - price
+        scores[priced] = _robust_z(residual[priced])
+
+    if current_year is None:
+        current_year = date.today().year
+    age = np.clip(current_year - year, 1, None)
+    mileage_z = _robust_z(mileage / age)
+    scores -= np.clip(mileage_z - MILEAGE_Z_LIMIT, 0, None)
+    return scores
+
+
+def select_for_llm(
+    scores: np.ndarray,
+    candidates: np.ndarray,
+    top_fraction: float = TOP_FRACTION,
+    threshold: float = SCORE_THRESHOLD,
+) -> np.ndarray:
+    """
+    Boolean mask of candidate cars worth a full LLM analysis: those ranking
+    in the best top_fraction of the whole pool plus every one scoring at or
+    above threshold.
+    """
+    n = len(scores)
+    if n < MIN_CARS_TO_FILTER:
+        return candidates.copy()
+    keep = int(np.ceil(n * top_fraction))
+    ranks = np.argsort(np.argsort(-scores, kind="stable"), kind="stable")
+    return candidates & ((ranks < keep) | (scores >= threshold))
@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 import sqlite3
 from helpers import fetch_html_with_cookie, clean_url
+from blobstore import init_blob_table, put_blob
+from db import ensure_column
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -56,11 +58,14 @@ def init_db() -> None:
                     year TEXT,
                     place TEXT,
                     raw_json TEXT,
+                    occasion_blob TEXT,
                     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """
             c.execute(sql)
             conn.commit()
+            ensure_column(conn, "raw_cars", "occasion_blob", "TEXT")
+            init_blob_table(conn)
             logger.info("Database initialized successfully")
 
     except sqlite3.Error as e:
@@ -77,23 +82,32 @@ def insert_raw_cars(cars: List[Dict[str, Any]]) -> None:
         with sqlite3.connect(DB_PATH) as conn:
             c = conn.cursor()
 
-            car_data = [
-                (
-                    car.get("title"),
-                    car.get("price"),
-                    car.get("mileage"),
-                    car.get("url"),
-                    car.get("year"),
-                    car.get("place"),
-                    json.dumps(car),
+            car_data = []
+            for car in cars:
+                fields = {k: v for k, v in car.items() if k != "occasion"}
+                occasion = car.get("occasion")
+                occasion_blob = (
+                    put_blob(conn, json.dumps(occasion, ensure_ascii=False))
+                    if occasion is not None
+                    else None
+                )
+                car_data.append(
+                    (
+                        car.get("title"),
+                        car.get("price"),
+                        car.get("mileage"),
+                        car.get("url"),
+                        car.get("year"),
+                        car.get("place"),
+                        json.dumps(fields),
+                        occasion_blob,
+                    )
                 )
-                for car in cars
-            ]
 
             c.executemany(
                 """
-                INSERT INTO raw_cars (title, price, mileage, url, year, place, raw_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO raw_cars (title, price, mileage, url, year, place, raw_json, occasion_blob)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 car_data,
             )
@@ -127,6 +141,8 @@ def process_occasions_to_cars(occasions: List[Dict[str, Any]]) -> List[Dict[str,
                 "url": url,
                 "year": occ.get("year"),
                 "place": occ.get("place"),
+                # Original Gaspedaal payload, stored as a compressed blob
+                "occasion": occ,
             }
 
             raw_cars.append(car_data)